@@ -9,21 +9,25 @@ class CToken:
     PUNCTUATION = 'PUNCT'  # {, }, (, ), ;, etc.
     KEYWORD = 'KEYWORD'    # if, while, return, etc.
     
-    def __init__(self, type, value, line=0):
+    def __init__(self, type, value, line=0, symbol=None):
         self.type = type
         self.value = value
         self.line = line
+        self.symbol = symbol  # SymbolTable의 정수 ID (인터닝한 경우)
     
     def __str__(self):
         return f"Token({self.type}, '{self.value}', line={self.line})"
 
 class CLexer:
     """C 언어 렉서 클래스 (외부 라이브러리 없이 구현)"""
-    def __init__(self, code):
+    def __init__(self, code, quiet=False, symbols=None):
         self.code = code
+        self.quiet = quiet  # True면 인식할 수 없는 문자 경고를 출력하지 않음
+        self.symbols = symbols  # 식별자/문자열을 인터닝할 SymbolTable (없으면 인터닝 안 함)
         self.position = 0
         self.line = 1
         self.tokens = []
+        self.warnings = []  # 인식할 수 없는 문자 경고 메시지
         self.current_char = None
         self.advance()
         
@@ -148,11 +152,18 @@ class CLexer:
             self.advance()
             
         if result in self.keywords:
-            return CToken(CToken.KEYWORD, result, self.line)
+            return self.make_symbol_token(CToken.KEYWORD, result)
         elif result in self.types:
-            return CToken(CToken.TYPE, result, self.line)
+            return self.make_symbol_token(CToken.TYPE, result)
         else:
-            return CToken(CToken.IDENTIFIER, result, self.line)
+            return self.make_symbol_token(CToken.IDENTIFIER, result)
+    
+    def make_symbol_token(self, type, value):
+        """이름/문자열 토큰 생성 (SymbolTable이 있으면 정규 문자열과 ID 사용)"""
+        if self.symbols is None:
+            return CToken(type, value, self.line)
+        symbol = self.symbols.intern(value)
+        return CToken(type, self.symbols.names[symbol], self.line, symbol)
             
     def get_string(self):
         """문자열 토큰 가져오기"""
@@ -178,7 +189,7 @@ class CLexer:
             self.advance()
             
         self.advance()  # 마지막 따옴표 건너뛰기
-        return CToken(CToken.STRING, result, self.line)
+        return self.make_symbol_token(CToken.STRING, result)
     
     def get_operator(self):
         """연산자 토큰 가져오기"""
@@ -221,7 +232,10 @@ class CLexer:
                 self.advance()
             else:
                 # 인식할 수 없는 문자는 건너뛰기
-                print(f"Warning: Unrecognized character '{self.current_char}' at line {self.line}")
+                warning = f"Warning: Unrecognized character '{self.current_char}' at line {self.line}"
+                self.warnings.append(warning)
+                if not self.quiet:
+                    print(warning)
                 self.advance()
         
         return self.tokens
@@ -229,7 +243,7 @@ class CLexer:
 class ASTNode:
     """AST 노드 기본 클래스"""
     def __init__(self):
-        pass
+        self.line = 0  # 노드가 시작되는 소스 줄 번호 (파서가 설정)
     
     def show(self, indent=0):
         """노드를 들여쓰기로 표시"""
@@ -240,6 +254,8 @@ class Program(ASTNode):
     def __init__(self, declarations=None):
         super().__init__()
         self.declarations = declarations or []
+        self.index = None  # 파싱 중 만들어진 NodeIndex
+        self.symbols = None  # 토큰을 인터닝한 SymbolTable (여러 파일이 공유할 수 있음)
     
     def __str__(self):
         return f"Program"
@@ -282,11 +298,12 @@ class CompoundStmt(ASTNode):
 
 class Decl(ASTNode):
     """변수 선언 노드"""
-    def __init__(self, name, type_name, init=None):
+    def __init__(self, name, type_name, init=None, symbol=None):
         super().__init__()
         self.name = name
         self.type = type_name
         self.init = init
+        self.symbol = symbol  # 변수 이름의 SymbolTable ID (인터닝한 경우)
     
     def __str__(self):
         init_str = f" = {self.init}" if self.init else ""
@@ -297,6 +314,51 @@ class Decl(ASTNode):
         if self.init and isinstance(self.init, ASTNode):
             self.init.show(indent + 2)
 
+class ArrayDecl(Decl):
+    """배열 선언 노드 (예: int a[3] = {1, 2, 3};)"""
+    def __init__(self, name, type_name, dim=None, init=None, symbol=None):
+        super().__init__(name, type_name, init, symbol)
+        self.dim = dim  # 배열 크기 식 (int a[] = {...} 이면 None)
+    
+    def __str__(self):
+        return f"ArrayDecl: {self.type} {self.name}[]"
+    
+    def show(self, indent=0):
+        ASTNode.show(self, indent)
+        if self.dim:
+            self.dim.show(indent + 2)
+        if self.init:
+            self.init.show(indent + 2)
+
+class InitList(ASTNode):
+    """배열 초기화 목록 노드 (예: {1, 2, 3})"""
+    def __init__(self, exprs=None):
+        super().__init__()
+        self.exprs = exprs or []
+    
+    def __str__(self):
+        return f"InitList"
+    
+    def show(self, indent=0):
+        super().show(indent)
+        for expr in self.exprs:
+            expr.show(indent + 2)
+
+class ArrayRef(ASTNode):
+    """배열 원소 참조 노드 (예: a[i])"""
+    def __init__(self, name, subscript):
+        super().__init__()
+        self.name = name  # 배열 이름 ID 노드
+        self.subscript = subscript
+    
+    def __str__(self):
+        return f"ArrayRef"
+    
+    def show(self, indent=0):
+        super().show(indent)
+        self.name.show(indent + 2)
+        self.subscript.show(indent + 2)
+
 class Constant(ASTNode):
     """상수 노드"""
     def __init__(self, type, value):
@@ -309,9 +371,10 @@ class Constant(ASTNode):
 
 class ID(ASTNode):
     """식별자 노드"""
-    def __init__(self, name):
+    def __init__(self, name, symbol=None):
         super().__init__()
         self.name = name
+        self.symbol = symbol  # SymbolTable ID (인터닝한 경우)
     
     def __str__(self):
         return f"ID: {self.name}"
@@ -379,9 +442,18 @@ class Return(ASTNode):
 
 class CParser:
     """C 언어 파서 클래스"""
-    def __init__(self, tokens):
+    def __init__(self, tokens, index=True):
         self.tokens = tokens
         self.pos = 0
+        self.indexing = index  # False면 NodeIndex를 만들지 않음 (조회하지 않는 CLI 실행용)
+        self.index = None  # 파싱과 같은 패스에서 채워지는 노드 인덱스
+    
+    def node(self, node, token):
+        """노드에 줄 번호를 기록하고 (인덱스를 만드는 경우) 인덱스에 등록"""
+        node.line = token.line if token else 0
+        if self.index is not None:
+            self.index.add(node)
+        return node
     
     def peek(self):
         """현재 토큰 확인"""
@@ -415,6 +487,13 @@ class CParser:
     
     def parse_program(self):
         """프로그램 파싱"""
+        # AST를 다시 만들 때 이전 인덱스가 남지 않도록 새로 시작
+        self.pos = 0
+        if self.indexing:
+            from c_node_index import NodeIndex
+            self.index = NodeIndex()
+        else:
+            self.index = None
         declarations = []
         
         while self.peek():
@@ -426,22 +505,25 @@ class CParser:
                 # 다른 글로벌 선언
                 self.consume()  # 일단 스킵
         
-        return Program(declarations)
+        program = self.node(Program(declarations), self.tokens[0] if self.tokens else None)
+        program.index = self.index
+        return program
     
     def parse_function_decl(self):
         """함수 선언 파싱"""
-        return_type = self.consume().value
+        type_token = self.consume()
+        return_type = type_token.value
         name_token = self.expect(CToken.IDENTIFIER)
         self.expect(CToken.PUNCTUATION, '(')
         params = []  # 매개변수 파싱 생략
         self.expect(CToken.PUNCTUATION, ')')
         
         body = self.parse_compound_stmt()
-        return FunctionDecl(return_type, name_token.value, params, body)
+        return self.node(FunctionDecl(return_type, name_token.value, params, body), type_token)
     
     def parse_compound_stmt(self):
         """복합 구문 (블록) 파싱"""
-        self.expect(CToken.PUNCTUATION, '{')
+        brace_token = self.expect(CToken.PUNCTUATION, '{')
         block_items = []
         
         while not self.match(CToken.PUNCTUATION, '}'):
@@ -455,7 +537,7 @@ class CParser:
             else:
                 block_items.append(self.parse_statement())
         
-        return CompoundStmt(block_items)
+        return self.node(CompoundStmt(block_items), brace_token)
     
     def parse_declaration(self):
         """변수 선언 파싱"""
@@ -463,20 +545,54 @@ class CParser:
         name_token = self.expect(CToken.IDENTIFIER)
         init = None
         
+        if self.match(CToken.PUNCTUATION, '['):
+            return self.parse_array_declaration(type_token, name_token)
+        
         if self.match(CToken.OPERATOR, '='):
             init = self.parse_expression()
         
         self.expect(CToken.PUNCTUATION, ';')
-        return Decl(name_token.value, type_token.value, init)
+        return self.node(Decl(name_token.value, type_token.value, init, name_token.symbol), type_token)
+    
+    def parse_array_declaration(self, type_token, name_token):
+        """배열 선언 파싱 ('[' 다음부터, 예: int a[3] = {1, 2, 3};)"""
+        dim = None
+        if not self.match(CToken.PUNCTUATION, ']'):
+            dim = self.parse_expression()
+            self.expect(CToken.PUNCTUATION, ']')
+        
+        init = None
+        if self.match(CToken.OPERATOR, '='):
+            init = self.parse_initializer_list()
+        
+        if dim is None and init is None:
+            raise SyntaxError(f"Array size missing in declaration of '{name_token.value}' at line {name_token.line}")
+        
+        self.expect(CToken.PUNCTUATION, ';')
+        return self.node(ArrayDecl(name_token.value, type_token.value, dim, init, name_token.symbol), type_token)
+    
+    def parse_initializer_list(self):
+        """배열 초기화 목록 파싱 (예: {1, 2, 3})"""
+        brace_token = self.expect(CToken.PUNCTUATION, '{')
+        exprs = []
+        
+        while not self.match(CToken.PUNCTUATION, '}'):
+            exprs.append(self.parse_expression())
+            if not self.match(CToken.PUNCTUATION, ','):
+                self.expect(CToken.PUNCTUATION, '}')
+                break
+        
+        return self.node(InitList(exprs), brace_token)
     
     def parse_statement(self):
         """구문 파싱"""
-        if self.match(CToken.KEYWORD, 'return'):
+        return_token = self.match(CToken.KEYWORD, 'return')
+        if return_token:
             expr = None
             if not self.peek() or self.peek().value != ';':
                 expr = self.parse_expression()
             self.expect(CToken.PUNCTUATION, ';')
-            return Return(expr)
+            return self.node(Return(expr), return_token)
         else:
             # 식 구문
             expr = self.parse_expression()
@@ -491,9 +607,14 @@ class CParser:
         """대입 식 파싱"""
         left = self.parse_binary_op()
         
-        if self.match(CToken.OPERATOR, '='):
+        op_token = self.match(CToken.OPERATOR, '=')
+        if op_token:
             right = self.parse_expression()
-            return Assignment('=', left, right)
+            assignment = Assignment('=', left, right)
+            assignment.line = left.line or op_token.line
+            if self.index is not None:
+                self.index.add(assignment)
+            return assignment
         
         return left
     
@@ -513,9 +634,10 @@ class CParser:
             if not token or token.type != CToken.OPERATOR or token.value not in precedence or precedence[token.value] < min_precedence:
                 break
             
-            op = self.consume().value
+            op_token = self.consume()
+            op = op_token.value
             right = self.parse_binary_op(precedence[op] + 1)
-            left = BinaryOp(op, left, right)
+            left = self.node(BinaryOp(op, left, right), op_token)
         
         return left
     
@@ -524,16 +646,22 @@ class CParser:
         token = self.peek()
         
         if self.match(CToken.NUMBER):
-            return Constant('int' if isinstance(token.value, int) else 'float', token.value)
+            return self.node(Constant('int' if isinstance(token.value, int) else 'float', token.value), token)
         
         if self.match(CToken.IDENTIFIER):
             if self.peek() and self.peek().value == '(':
                 self.pos -= 1  # 토큰 되돌리기
                 return self.parse_function_call()
-            return ID(token.value)
+            name = self.node(ID(token.value, token.symbol), token)
+            if self.match(CToken.PUNCTUATION, '['):
+                # 배열 원소 참조
+                subscript = self.parse_expression()
+                self.expect(CToken.PUNCTUATION, ']')
+                return self.node(ArrayRef(name, subscript), token)
+            return name
         
         if self.match(CToken.STRING):
-            return Constant('string', token.value)
+            return self.node(Constant('string', token.value), token)
         
         if self.match(CToken.PUNCTUATION, '('):
             expr = self.parse_expression()
@@ -556,14 +684,145 @@ class CParser:
             
             self.expect(CToken.PUNCTUATION, ')')
         
-        return FuncCall(name_token.value, args)
+        return self.node(FuncCall(name_token.value, args), name_token)
+
+class BudgetExceeded(Exception):
+    """평가 예산(실행한 문장 수, 시간, 변수/출력 개수)을 넘었을 때 발생하는 예외"""
+    def __init__(self, reason, limit):
+        super().__init__(f"{reason} limit {limit} exceeded")
+        self.reason = reason  # 'steps', 'time', 'variables', 'outputs'
+        self.limit = limit
+
+class EvaluationResult:
+    """ASTEvaluator.run()의 결과 (예산을 넘었으면 그때까지의 부분 결과)"""
+    def __init__(self, print_results, steps, budget_exceeded=None):
+        self.print_results = print_results
+        self.steps = steps  # 실행한 문장 수 (예산이 설정된 경우에만 셈)
+        self.budget_exceeded = budget_exceeded  # BudgetExceeded 또는 None
+    
+    @property
+    def completed(self):
+        """예산 안에서 끝까지 평가했는지 여부"""
+        return self.budget_exceeded is None
 
 class ASTEvaluator:
     """AST를 순회하며 printf() 함수의 결과를 계산하는 클래스"""
-    def __init__(self):
+    BUDGET_CHECK_INTERVAL = 1024  # 시간 한도를 확인하는 간격 (실행한 문장 수)
+    
+    def __init__(self, dead=None, max_steps=None, timeout=None, max_vars=None, max_outputs=None,
+                 on_output=None, collect=True):
+        self.dead = dead or set()  # 실행하지 않을 죽은 문장 (LivenessAnalyzer 결과)
+        self.on_output = on_output  # printf 결과가 나올 때마다 호출할 함수 (예: 큐의 put_nowait)
+        self.collect = collect  # False면 print_results에 쌓지 않아 출력이 많아도 메모리가 일정
+        
+        # 평가 예산 (None이면 제한 없음)
+        self.max_steps = max_steps
+        self.timeout = timeout  # 초 단위
+        self.max_vars = max_vars
+        self.max_outputs = max_outputs
+        self.budgeted = any(limit is not None for limit in (max_steps, timeout, max_vars))
+        if timeout is not None:
+            import time
+            self.clock = time.monotonic
+        self.reset()
+    
+    def reset(self):
+        """평가 상태를 비우고 예산을 다시 시작 (run()/iter_results()가 시작할 때마다 호출)"""
         self.env = {}  # 변수 저장소: {변수이름: 값}
-        self.print_results = []  # printf 결과 저장
+        self.print_results = []  # printf 결과 저장 (collect가 False면 비어 있음)
         self.var_types = {}  # 변수 타입 저장: {변수이름: 타입}
+        self.output_count = 0  # 지금까지 나온 printf 결과 수
+        self.array_slots = 0  # 배열 원소 수에서 배열 개수를 뺀 값 (저장 개수 예산에 더함)
+        self.steps = 0
+        self.next_check = 0  # 다음에 예산을 확인할 문장 번호
+        # 시간 한도는 평가를 시작할 때부터 잼
+        self.deadline = self.clock() + self.timeout if self.timeout is not None else None
+    
+    def run(self, node):
+        """예산 안에서 AST를 평가하고 EvaluationResult 반환 (이전 실행의 상태는 지움)"""
+        self.reset()
+        try:
+            self.visit(node)
+            if self.budgeted:
+                self.check_budget()
+        except BudgetExceeded as e:
+            return EvaluationResult(self.print_results, self.steps, e)
+        return EvaluationResult(self.print_results, self.steps)
+    
+    def iter_results(self, node):
+        """printf 결과를 만들어지는 대로 내보내는 제너레이터
+        
+        문장 하나를 실행할 때마다 그 문장이 만든 결과를 바로 내보내며, 결과를 모아 두지 않습니다.
+        on_output이 설정되어 있으면 결과마다 함께 호출하고, 끝나면 on_output/collect 설정을 되돌립니다.
+        예산을 넘으면 그때까지의 결과를 내보낸 뒤 BudgetExceeded를 발생시킵니다.
+        """
+        self.reset()
+        pending = []
+        saved_on_output, saved_collect = self.on_output, self.collect
+        
+        def forward(value):
+            """결과를 제너레이터 버퍼에 넣고 사용자 콜백에도 전달"""
+            pending.append(value)
+            if saved_on_output is not None:
+                saved_on_output(value)
+        
+        self.on_output = forward
+        self.collect = False
+        try:
+            for _ in self.iter_statements(node):
+                if pending:
+                    yield from pending
+                    pending.clear()
+            if self.budgeted:
+                self.check_budget()
+        finally:
+            self.on_output, self.collect = saved_on_output, saved_collect
+    
+    def iter_statements(self, node):
+        """main 함수 본문의 문장을 하나씩 실행하며 매 문장 뒤에 멈추는 제너레이터"""
+        if isinstance(node, Program):
+            for decl in node.declarations:
+                yield from self.iter_statements(decl)
+        elif isinstance(node, FunctionDecl):
+            if node.name == 'main':
+                yield from self.execute_block(node.body)
+        elif isinstance(node, CompoundStmt):
+            yield from self.execute_block(node)
+        else:
+            self.visit(node)
+            yield node
+    
+    def emit(self, value):
+        """printf 결과 하나를 저장하거나 on_output으로 전달"""
+        if self.max_outputs is not None and self.output_count >= self.max_outputs:
+            raise BudgetExceeded('outputs', self.max_outputs)
+        self.output_count += 1
+        if self.collect:
+            self.print_results.append(value)
+        if self.on_output is not None:
+            self.on_output(value)
+    
+    def check_budget(self):
+        """예산 초과 여부를 확인하고 다음 확인 시점 계산"""
+        if self.max_steps is not None and self.steps > self.max_steps:
+            raise BudgetExceeded('steps', self.max_steps)
+        if self.deadline is not None and self.clock() > self.deadline:
+            raise BudgetExceeded('time', self.timeout)
+        if self.max_vars is not None and self.stored_count() > self.max_vars:
+            raise BudgetExceeded('variables', self.max_vars)
+        
+        # 문장 하나는 보통 변수를 하나만 늘리므로, 어떤 한도도 넘을 수 없는 만큼 건너뛰고 다음에 확인
+        # (출력 개수는 emit()에서 바로 확인)
+        gap = self.BUDGET_CHECK_INTERVAL if self.deadline is not None else float('inf')
+        if self.max_steps is not None:
+            gap = min(gap, self.max_steps - self.steps + 1)
+        if self.max_vars is not None:
+            gap = min(gap, self.max_vars - self.stored_count() + 1)
+        self.next_check = self.steps + max(gap, 1)
+    
+    def stored_count(self):
+        """저장된 값의 수 (스칼라 변수는 1, 배열은 원소 수만큼)"""
+        return len(self.env) + self.array_slots
     
     def visit(self, node):
         """노드 방문"""
@@ -586,13 +845,50 @@ class ASTEvaluator:
             self.visit(node.body)
     
     def visit_CompoundStmt(self, node):
-        """복합 구문 노드 방문"""
+        """복합 구문 노드 방문 (결과를 하나씩 내보내지 않으므로 제너레이터 없이 실행)"""
+        if not self.budgeted and not self.dead:
+            # 예산도 죽은 문장도 없으면 문장마다 추가 비용이 없는 기본 경로
+            for item in node.block_items:
+                self.visit(item)
+            return
+        budgeted = self.budgeted
         for item in node.block_items:
+            if budgeted:
+                # 예산 확인은 next_check 번째 문장에 도달했을 때만 수행
+                self.steps += 1
+                if self.steps >= self.next_check:
+                    self.check_budget()
+            if item in self.dead:
+                # 죽은 선언도 이후 대입의 형 변환에 필요하므로 타입은 기록
+                if isinstance(item, Decl):
+                    self.var_types[item.name] = item.type
+                continue
             self.visit(item)
     
+    def execute_block(self, node):
+        """블록의 문장을 차례로 실행하며 매 문장 뒤에 멈추는 제너레이터 (iter_statements()용, 예산/죽은 문장 처리는 visit_CompoundStmt와 같음)"""
+        budgeted = self.budgeted
+        for item in node.block_items:
+            if budgeted:
+                # 예산 확인은 next_check 번째 문장에 도달했을 때만 수행
+                self.steps += 1
+                if self.steps >= self.next_check:
+                    self.check_budget()
+            if item in self.dead:
+                # 죽은 선언도 이후 대입의 형 변환에 필요하므로 타입은 기록
+                if isinstance(item, Decl):
+                    self.var_types[item.name] = item.type
+                continue
+            self.visit(item)
+            yield item
+    
     def visit_Decl(self, node):
         """변수 선언 노드 방문"""
         self.var_types[node.name] = node.type
+        # 같은 이름의 배열을 스칼라로 다시 선언하면 배열 원소 수는 저장 개수에서 빠짐
+        previous = self.env.get(node.name)
+        if hasattr(previous, 'typecode'):
+            self.array_slots -= len(previous) - 1
         if node.init:
             value = self.visit(node.init)
             # 타입에 따라 값 변환
@@ -608,6 +904,60 @@ class ASTEvaluator:
             # 초기값 없으면 기본값 0
             self.env[node.name] = 0
     
+    def visit_ArrayDecl(self, node):
+        """배열 선언 노드 방문 (선언한 타입에 맞는 연속 버퍼 array('l')/array('d')에 저장)"""
+        from array import array
+        self.var_types[node.name] = node.type
+        typecode = 'd' if node.type in ['float', 'double'] else 'l'
+        values = [self.visit(expr) for expr in node.init.exprs] if node.init else []
+        size = self.visit(node.dim) if node.dim else len(values)
+        if not isinstance(size, int) or size <= 0:
+            raise ValueError(f"Invalid size {size} for array '{node.name}'")
+        if len(values) > size:
+            raise ValueError(f"Too many initializers for array '{node.name}' (size {size})")
+        # 버퍼를 만들기 전에 원소 수를 저장 개수 예산에 맞춰 확인 (같은 이름을 다시 선언하면 예전 값은 빠짐)
+        previous = self.env.get(node.name)
+        replaced = len(previous) if hasattr(previous, 'typecode') else 1 if node.name in self.env else 0
+        if self.max_vars is not None and self.stored_count() - replaced + size > self.max_vars:
+            raise BudgetExceeded('variables', self.max_vars)
+        
+        # 초기값이 없는 원소는 0
+        buffer = array(typecode, [0]) * size
+        for i, value in enumerate(values):
+            self.store_element(node.name, buffer, i, value)
+        if hasattr(previous, 'typecode'):
+            self.array_slots -= len(previous) - 1
+        self.array_slots += size - 1
+        self.env[node.name] = buffer
+        # 배열은 한 번에 여러 칸을 쓰므로 check_budget()이 계산한 간격이 맞지 않음: 다음 문장에서 다시 확인
+        self.next_check = min(self.next_check, self.steps + 1)
+    
+    def array_slot(self, node):
+        """배열 원소 참조의 (버퍼, 인덱스) 반환 (범위 검사 포함)"""
+        name = node.name.name
+        buffer = self.env.get(name)
+        if not hasattr(buffer, 'typecode'):
+            raise TypeError(f"'{name}' is not an array")
+        index = self.visit(node.subscript)
+        if isinstance(index, float):
+            raise TypeError(f"Array index {index} for '{name}' is not an integer")
+        if not 0 <= index < len(buffer):
+            raise IndexError(f"Array index {index} out of bounds for '{name}' (size {len(buffer)})")
+        return buffer, index
+    
+    def store_element(self, name, buffer, index, value):
+        """배열 원소에 값 저장 (버퍼 타입에 맞게 변환, array('l')에 들어가지 않는 정수는 오류)"""
+        try:
+            buffer[index] = float(value) if buffer.typecode == 'd' else int(value)
+        except OverflowError:
+            raise OverflowError(f"Value {value} does not fit in element {index} of int array '{name}'") from None
+        return buffer[index]
+    
+    def visit_ArrayRef(self, node):
+        """배열 원소 읽기"""
+        buffer, index = self.array_slot(node)
+        return buffer[index]
+    
     def visit_Constant(self, node):
         """상수 노드 방문"""
         return node.value
@@ -641,6 +991,8 @@ class ASTEvaluator:
         """대입 연산 노드 방문"""
         if isinstance(node.lvalue, ID):
             var_name = node.lvalue.name
+            if hasattr(self.env.get(var_name), 'typecode'):
+                raise TypeError(f"Cannot assign to array '{var_name}' (assign to an element such as {var_name}[0])")
             value = self.visit(node.rvalue)
             var_type = self.var_types.get(var_name)
             # 값을 변수 타입에 맞게 변환하여 저장
@@ -652,15 +1004,24 @@ class ASTEvaluator:
                 else:
                     self.env[var_name] = value
             return self.env[var_name]
+        if isinstance(node.lvalue, ArrayRef):
+            # 배열 원소 쓰기 (버퍼 타입에 맞게 변환)
+            buffer, index = self.array_slot(node.lvalue)
+            value = self.visit(node.rvalue)
+            return self.store_element(node.lvalue.name.name, buffer, index, value)
         return 0
     
     def visit_FuncCall(self, node):
         """함수 호출 노드 방문"""
         if node.name == 'printf':
             args = node.args
-            if len(args) >= 2 and isinstance(args[1], ID):
-                var_name = args[1].name
-                value = self.env.get(var_name, 0)
+            if len(args) >= 2 and isinstance(args[1], (ID, ArrayRef)):
+                if isinstance(args[1], ID):
+                    value = self.env.get(args[1].name, 0)
+                    if hasattr(value, 'typecode'):
+                        raise TypeError(f"Cannot print array '{args[1].name}' with printf (use an element such as {args[1].name}[0])")
+                else:
+                    value = self.visit(args[1])
                 
                 # 포맷 문자열에 따라 값 형식 조정
                 if isinstance(args[0], Constant) and args[0].type == 'string':
@@ -673,7 +1034,7 @@ class ASTEvaluator:
                         # 실수 포맷이면 실수로 유지
                         value = float(value)
                 
-                self.print_results.append(value)
+                self.emit(value)
                 return value
         return 0
     
@@ -683,46 +1044,58 @@ class ASTEvaluator:
             return self.visit(node.expr)
         return 0
 
-def parse_c_file(filepath):
-    """C 파일 파싱"""
+def parse_c_file(filepath, jobs=1, symbols=None, index=True):
+    """C 파일 파싱 (jobs가 1이 아니면 여러 프로세스로 렉싱, None이면 CPU 수만큼, index가 False면 NodeIndex 생략)"""
     with open(filepath, 'r') as f:
         code = f.read()
     
     # 렉싱
-    lexer = CLexer(code)
-    tokens = lexer.tokenize()
+    if jobs == 1:
+        lexer = CLexer(code, symbols=symbols)
+        tokens = lexer.tokenize()
+    else:
+        from c_parallel_lex import parallel_tokenize
+        tokens = parallel_tokenize(code, jobs, symbols=symbols)
     
     # 파싱
-    parser = CParser(tokens)
+    parser = CParser(tokens, index)
     ast = parser.parse_program()
+    ast.symbols = symbols
     
     return ast
 
-def main():
-    """메인 함수"""
-    if len(sys.argv) < 2:
-        print("Usage: python 2025_assignment2.py <c_file_path>")
-        sys.exit(1)
+def parse_c_files(filepaths, jobs=1, symbols=None, index=True):
+    """여러 C 파일을 하나의 SymbolTable을 공유하며 파싱하고 AST 목록 반환"""
+    if symbols is None:
+        from c_symbols import SymbolTable
+        symbols = SymbolTable()
+    return [parse_c_file(filepath, jobs, symbols, index) for filepath in filepaths]
+
+# 스크립트를 실행할 때마다 컴파일하는 양을 줄이려고 별도 모듈로 분리한 이름 (처음 접근할 때 불러옴)
+LAZY_EXPORTS = {
+    'SymbolTable': 'c_symbols',
+    'NodeIndex': 'c_node_index',
+    'LivenessAnalyzer': 'c_liveness',
+    'split_chunks': 'c_parallel_lex',
+    'lex_chunk': 'c_parallel_lex',
+    'parallel_tokenize': 'c_parallel_lex',
+    'USAGE': 'c_cli',
+    'parse_cli_args': 'c_cli',
+    'run_file': 'c_cli',
+}
 
-    # C 파일 파싱 및 AST 생성
-    try:
-        ast = parse_c_file(sys.argv[1])
-        
-        # AST 출력
-        ast.show()
-        
-        # AST 평가 및 printf() 결과 계산
-        evaluator = ASTEvaluator()
-        evaluator.visit(ast)
-        
-        # 모든 printf 결과 출력
-        for result in evaluator.print_results:
-            print(f'Computation Result: {result}')
-    except Exception as e:
-        print(f"Error: {e}")
-        # 디버깅 정보 출력
-        import traceback
-        traceback.print_exc()
+def __getattr__(name):
+    """module.NodeIndex처럼 분리된 모듈의 이름에 접근하면 그 모듈을 불러와 반환"""
+    if name in LAZY_EXPORTS:
+        return getattr(__import__(LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def main():
+    """메인 함수 (명령행 처리는 c_cli 모듈에 있어 스크립트를 실행할 때마다 컴파일하지 않음)"""
+    from c_cli import main
+    return main()
 
 if __name__ == "__main__":
+    # 분리된 모듈이 __import__('2025_assignment2')로 같은 AST 클래스를 쓰도록 이 스크립트를 등록
+    sys.modules.setdefault('2025_assignment2', sys.modules[__name__])
     main()
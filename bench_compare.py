@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+bench_compare.py
+직접 구현한 프론트엔드(2025_assignment2.py)와 pycparser 기반 구현(back-up.py) 비교 벤치마크
+
+테스트 C 파일과 생성한 큰 프로그램에 대해 두 구현을 모두 실행하여
+- 단계별(전처리/렉싱/파싱/평가) 시간과 최대 메모리 사용량을 보고하고
+- 두 구현의 print_results가 같은지 확인합니다 (다르면 종료 코드 1).
+pycparser가 설치되어 있지 않거나 back-up.py가 지원하지 않는 문법(배열 등)을 쓰는 테스트 파일은
+pycparser 쪽을 건너뜁니다.
+
+사용법: python bench_compare.py [--sizes N,N,...] [--repeat N]
+"""
+
+import glob
+import importlib.util
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# back-up.py가 지원하지 않는 문법을 쓰는 테스트 파일 (직접 구현한 쪽만 측정)
+BACKUP_UNSUPPORTED = {'test_array.c'}
+
+def load_custom():
+    """직접 구현한 프론트엔드 모듈 로드"""
+    sys.path.insert(0, HERE)
+    return __import__('2025_assignment2')
+
+def load_backup():
+    """back-up.py 로드 (pycparser가 없으면 None)"""
+    spec = importlib.util.spec_from_file_location('backup_evaluator', os.path.join(HERE, 'back-up.py'))
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except ImportError:
+        return None
+    return module
+
+def strip_comments(code):
+    """주석과 전처리기 줄을 공백으로 바꾸기 (cpp 없이 pycparser에 넘기기 위함, 줄 번호 유지)"""
+    result = []
+    i = 0
+    n = len(code)
+    at_line_start = True
+    while i < n:
+        c = code[i]
+        if c == '"':
+            # 문자열 리터럴은 그대로 복사
+            j = i + 1
+            while j < n and code[j] != '"':
+                j += 2 if code[j] == '\\' else 1
+            result.append(code[i:j + 1])
+            i = j + 1
+        elif code.startswith('//', i) or (c == '#' and at_line_start):
+            while i < n and code[i] != '\n':
+                i += 1
+        elif code.startswith('/*', i):
+            end = code.find('*/', i + 2)
+            end = n if end < 0 else end + 2
+            result.append('\n' * code.count('\n', i, end) or ' ')
+            i = end
+        else:
+            result.append(c)
+            i += 1
+        if c == '\n':
+            at_line_start = True
+        elif c not in ' \t\r':
+            at_line_start = False
+    return ''.join(result)
+
+def generate_program(n_stmts, seed=0):
+    """두 구현이 모두 지원하는 int/double 선언, 대입, printf로 이루어진 큰 프로그램 생성"""
+    rng = random.Random(seed)
+    lines = ['int main() {', '    int v0 = 7;', '    double d0 = 1.5;']
+    ints, doubles = ['v0'], ['d0']
+    for k in range(1, n_stmts):
+        choice = rng.random()
+        if choice < 0.45:
+            a, b = rng.choice(ints), rng.choice(ints)
+            op = rng.choice(['+', '-', '^', '|'])
+            c = rng.randint(1, 9)
+            expr = rng.choice([f'({a} {op} {b}) & 1023', f'{a} / {c} + {b}', f'({a} & 255) * {c}'])
+            lines.append(f'    int v{k} = {expr};')
+            ints.append(f'v{k}')
+        elif choice < 0.7:
+            a, b = rng.choice(doubles), rng.choice(doubles)
+            op = rng.choice(['+', '-'])
+            lines.append(f'    double d{k} = {a} {op} {b} / 2.0;')
+            doubles.append(f'd{k}')
+        elif choice < 0.85:
+            target = rng.choice(ints)
+            lines.append(f'    {target} = {rng.choice(ints)} + {rng.randint(1, 9)};')
+        else:
+            if rng.random() < 0.5:
+                lines.append(f'    printf("%d", {rng.choice(ints)});')
+            else:
+                lines.append(f'    printf("%f", {rng.choice(doubles)});')
+    lines += ['    return 0;', '}']
+    return '\n'.join(lines) + '\n'
+
+def measure(func, repeat):
+    """함수를 repeat번 실행한 최소 시간(ms)과 별도 실행의 최대 메모리(KB), 결과 반환"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / 1024, result
+
+def run_custom(custom, code, repeat):
+    """직접 구현한 프론트엔드의 단계별 측정"""
+    phases = {}
+    # 경고가 보고서에 섞이지 않도록 quiet, CLI처럼 NodeIndex 없이 파싱
+    lex_ms, lex_kb, tokens = measure(lambda: custom.CLexer(code, quiet=True).tokenize(), repeat)
+    phases['lex'] = (lex_ms, lex_kb)
+    parse_ms, parse_kb, ast = measure(lambda: custom.CParser(tokens, index=False).parse_program(), repeat)
+    phases['parse'] = (parse_ms, parse_kb)
+
+    def evaluate():
+        evaluator = custom.ASTEvaluator()
+        evaluator.visit(ast)
+        return evaluator.print_results
+    eval_ms, eval_kb, results = measure(evaluate, repeat)
+    phases['eval'] = (eval_ms, eval_kb)
+    return phases, results
+
+def run_backup(backup, code, repeat):
+    """pycparser 기반 구현의 단계별 측정"""
+    from pycparser import c_parser
+
+    phases = {}
+    pre_ms, pre_kb, text = measure(lambda: strip_comments(code), repeat)
+    phases['preprocess'] = (pre_ms, pre_kb)
+    parser = c_parser.CParser()  # 파서 테이블 생성 비용은 한 번만 지불
+    parse_ms, parse_kb, ast = measure(lambda: parser.parse(text), repeat)
+    phases['parse'] = (parse_ms, parse_kb)
+
+    def evaluate():
+        evaluator = backup.ASTEvaluator()
+        evaluator.visit(ast)
+        return evaluator.print_results
+    eval_ms, eval_kb, results = measure(evaluate, repeat)
+    phases['eval'] = (eval_ms, eval_kb)
+    return phases, results
+
+def format_phases(phases):
+    """단계별 측정값 문자열"""
+    total = sum(ms for ms, _ in phases.values())
+    parts = [f"{name} {ms:.2f} ms/{kb:.0f} KB" for name, (ms, kb) in phases.items()]
+    return f"total {total:.2f} ms | " + ', '.join(parts)
+
+def parse_args(argv):
+    """벤치마크 옵션 파싱"""
+    options = {'sizes': [1000, 10000], 'repeat': 3}
+    i = 0
+    while i < len(argv):
+        if argv[i] == '--sizes':
+            options['sizes'] = [int(n) for n in argv[i + 1].split(',') if n]
+            i += 1
+        elif argv[i] == '--repeat':
+            options['repeat'] = int(argv[i + 1])
+            i += 1
+        else:
+            raise SystemExit(f"Unknown option: {argv[i]}")
+        i += 1
+    return options
+
+def main():
+    """메인 함수"""
+    options = parse_args(sys.argv[1:])
+    custom = load_custom()
+    backup = load_backup()
+    if backup is None:
+        print("pycparser is not installed: skipping back-up.py comparison")
+
+    cases = []
+    for path in sorted(glob.glob(os.path.join(HERE, 'test*.c'))):
+        with open(path, 'r') as f:
+            cases.append((os.path.basename(path), f.read()))
+    for size in options['sizes']:
+        cases.append((f"generated[{size}]", generate_program(size)))
+
+    mismatches = 0
+    for name, code in cases:
+        phases, results = run_custom(custom, code, options['repeat'])
+        print(f"{name}")
+        print(f"  custom:    {format_phases(phases)}")
+        if backup is None:
+            continue
+        if name in BACKUP_UNSUPPORTED:
+            print("  pycparser: skipped (not supported by back-up.py)")
+            continue
+        backup_phases, backup_results = run_backup(backup, code, options['repeat'])
+        print(f"  pycparser: {format_phases(backup_phases)}")
+        if results == backup_results:
+            print(f"  results match ({len(results)} printf)")
+        else:
+            mismatches += 1
+            print(f"  MISMATCH: custom {results[:5]}... vs pycparser {backup_results[:5]}...")
+
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
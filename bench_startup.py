@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+bench_startup.py
+CLI 시작 시간 벤치마크
+
+- `-X importtime`으로 CLI 실행 시 추가로 import 되는 모듈을 기록합니다.
+- 빈 파일과 작은 파일(test.c)에 대해 종단 간 지연 시간을 측정합니다.
+- 허용되지 않은 모듈이 import 되거나, 빈 인터프리터 대비 지연 시간이
+  한도를 넘으면 종료 코드 1로 실패합니다.
+
+사용법: python bench_startup.py [--runs N] [--max-overhead-ms MS] [--output FILE]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ENTRY_POINTS = ['c_ast_parser.py', '2025_assignment2.py']
+SMALL_FILE = os.path.join(HERE, 'test.c')
+
+# 시작 시 import 되어도 되는 모듈 (빈 인터프리터가 이미 불러오는 모듈은 자동으로 제외)
+ALLOWED_MODULES = {'2025_assignment2', 'c_cli'}
+
+# 실제 배포 환경처럼 바이트코드 캐시(__pycache__)를 쓰도록 함
+CHILD_ENV = {k: v for k, v in os.environ.items() if k != 'PYTHONDONTWRITEBYTECODE'}
+
+def run_once(args):
+    """프로세스를 한 번 실행하고 걸린 시간(ms)과 결과 반환"""
+    start = time.perf_counter()
+    proc = subprocess.run(args, capture_output=True, text=True, cwd=HERE, env=CHILD_ENV)
+    elapsed = (time.perf_counter() - start) * 1000
+    return elapsed, proc
+
+def median_latency(args, runs):
+    """여러 번 실행한 지연 시간의 중앙값(ms)"""
+    # 첫 실행은 바이트코드 캐시 생성을 위한 워밍업
+    run_once(args)
+    return statistics.median(run_once(args)[0] for _ in range(runs))
+
+def imported_modules(args):
+    """-X importtime 출력에서 import 된 모듈 이름과 누적 시간(us) 수집"""
+    run_once([sys.executable] + args)  # 워밍업
+    _, proc = run_once([sys.executable, '-X', 'importtime'] + args)
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        parts = line[len('import time:'):].split('|')
+        name = parts[2].strip()
+        try:
+            modules[name] = int(parts[1])
+        except ValueError:
+            continue  # 헤더 줄
+    return modules
+
+def parse_args(argv):
+    """벤치마크 옵션 파싱"""
+    options = {'runs': 20, 'max_overhead_ms': 20.0, 'output': None}
+    i = 0
+    while i < len(argv):
+        if argv[i] == '--runs':
+            options['runs'] = int(argv[i + 1])
+            i += 1
+        elif argv[i] == '--max-overhead-ms':
+            options['max_overhead_ms'] = float(argv[i + 1])
+            i += 1
+        elif argv[i] == '--output':
+            options['output'] = argv[i + 1]
+            i += 1
+        else:
+            raise SystemExit(f"Unknown option: {argv[i]}")
+        i += 1
+    return options
+
+def main():
+    """메인 함수"""
+    options = parse_args(sys.argv[1:])
+    lines = []
+    failures = []
+
+    with tempfile.NamedTemporaryFile('w', suffix='.c', delete=False) as f:
+        empty_file = f.name
+    try:
+        baseline_modules = imported_modules(['-c', 'pass'])
+        baseline_ms = median_latency([sys.executable, '-c', 'pass'], options['runs'])
+        lines.append(f"interpreter baseline: {baseline_ms:.1f} ms")
+
+        for entry in ENTRY_POINTS:
+            # import 된 모듈 검사 (빈 파일 기준)
+            modules = imported_modules([entry, empty_file])
+            extra = {name: us for name, us in modules.items() if name not in baseline_modules}
+            for name, us in sorted(extra.items(), key=lambda item: -item[1]):
+                lines.append(f"{entry}: import {name} ({us} us cumulative)")
+            unexpected = sorted(set(extra) - ALLOWED_MODULES)
+            if unexpected:
+                failures.append(f"{entry}: unexpected imports at startup: {', '.join(unexpected)}")
+
+            # 종단 간 지연 시간 (빈 파일, 작은 파일)
+            for label, path in (('empty', empty_file), ('small', SMALL_FILE)):
+                latency = median_latency([sys.executable, entry, path], options['runs'])
+                overhead = latency - baseline_ms
+                lines.append(f"{entry} [{label}]: {latency:.1f} ms (+{overhead:.1f} ms)")
+                if overhead > options['max_overhead_ms']:
+                    failures.append(f"{entry} [{label}]: overhead {overhead:.1f} ms exceeds "
+                                    f"{options['max_overhead_ms']:.1f} ms")
+    finally:
+        os.unlink(empty_file)
+
+    report = '\n'.join(lines + [f"FAIL: {msg}" for msg in failures])
+    print(report)
+    if options['output']:
+        with open(options['output'], 'w') as f:
+            f.write(report + '\n')
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+c_ast_parser.py
+빠른 시작을 위한 최소 CLI 진입점
+
+python 2025_assignment2.py 로 실행하면 스크립트 전체를 매번 소스에서 컴파일하지만,
+이 진입점은 c_cli와 2025_assignment2 모듈을 import 하므로 __pycache__의 바이트코드를 재사용합니다.
+"""
+
+import sys
+
+if __name__ == "__main__":
+    from c_cli import main
+    sys.exit(main())
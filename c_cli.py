@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+c_cli.py
+명령행 옵션 처리와 파일별 실행 (2025_assignment2.main()과 c_ast_parser.py가 사용)
+
+python 2025_assignment2.py 로 실행하면 스크립트 전체를 매번 컴파일하므로, 명령행 처리는
+바이트코드 캐시를 쓰는 이 모듈에 둡니다.
+"""
+
+import sys
+
+# 모듈 이름이 숫자로 시작하므로 import 문 대신 __import__ 사용
+c_ast = __import__('2025_assignment2')
+parse_c_file = c_ast.parse_c_file
+ASTEvaluator = c_ast.ASTEvaluator
+BudgetExceeded = c_ast.BudgetExceeded
+
+USAGE = ("Usage: python 2025_assignment2.py [--no-ast] [--no-eval] [--dce] [--hide-dead] "
+         "[--max-steps N] [--timeout SEC] [--max-vars N] [--max-outputs N] [--jobs N] <c_file_path> [...]")
+
+# 값을 받는 옵션: {옵션: (options 키, 변환 함수)}
+VALUE_OPTIONS = {
+    '--max-steps': ('max_steps', int),
+    '--timeout': ('timeout', float),
+    '--max-vars': ('max_vars', int),
+    '--max-outputs': ('max_outputs', int),
+    '--jobs': ('jobs', int),  # 렉싱 프로세스 수 (0이면 CPU 수만큼)
+}
+
+def parse_cli_args(argv):
+    """명령행 인자 파싱 (시작 시간을 줄이기 위해 argparse 대신 직접 처리)"""
+    options = {'show_ast': True, 'evaluate': True, 'dce': False, 'hide_dead': False, 'paths': [],
+               'max_steps': None, 'timeout': None, 'max_vars': None, 'max_outputs': None, 'jobs': 1}
+    args = iter(argv)
+    for arg in args:
+        if arg in VALUE_OPTIONS:
+            key, convert = VALUE_OPTIONS[arg]
+            value = next(args, None)
+            if value is None:
+                raise ValueError(f"Missing value for option: {arg}")
+            try:
+                options[key] = convert(value)
+            except ValueError:
+                raise ValueError(f"Invalid value for option {arg}: {value}")
+            if key == 'jobs' and options[key] < 0:
+                raise ValueError(f"Invalid value for option {arg}: {value}")
+        elif arg == '--no-ast':
+            options['show_ast'] = False
+        elif arg == '--no-eval':
+            options['evaluate'] = False
+        elif arg == '--dce':
+            options['dce'] = True
+        elif arg == '--hide-dead':
+            options['dce'] = options['hide_dead'] = True
+        elif arg.startswith('--'):
+            raise ValueError(f"Unknown option: {arg}")
+        else:
+            options['paths'].append(arg)
+    return options
+
+def run_file(path, options, symbols=None):
+    """C 파일 하나의 AST 출력과 printf 결과 계산"""
+    # C 파일 파싱 및 AST 생성
+    try:
+        # CLI는 NodeIndex를 조회하지 않으므로 만들지 않음
+        ast = parse_c_file(path, options['jobs'] or None, symbols, index=False)
+        
+        # 활성 변수 분석으로 죽은 선언/대입 찾기 (--dce)
+        dead = None
+        if options['dce']:
+            from c_liveness import LivenessAnalyzer
+            liveness = LivenessAnalyzer()
+            dead = liveness.analyze(ast)
+            print(f"Dead statements removed: {liveness.removed_count}", file=sys.stderr)
+        
+        # AST 출력 (--no-ast 이면 건너뜀, --hide-dead 이면 죽은 문장 제외)
+        if options['show_ast']:
+            (liveness.prune(ast) if options['hide_dead'] else ast).show()
+        
+        # AST 평가 및 printf() 결과 계산 (--no-eval 이면 평가기를 만들지 않음)
+        if options['evaluate']:
+            evaluator = ASTEvaluator(dead, max_steps=options['max_steps'], timeout=options['timeout'],
+                                     max_vars=options['max_vars'], max_outputs=options['max_outputs'])
+            
+            # printf 결과를 만들어지는 대로 바로 출력 (예산을 넘으면 그때까지의 결과만)
+            try:
+                for result in evaluator.iter_results(ast):
+                    print(f'Computation Result: {result}', flush=True)
+            except BudgetExceeded as e:
+                print(f"Budget exceeded: {e}")
+    except Exception as e:
+        print(f"Error: {e}")
+        # 디버깅 정보 출력 (오류가 났을 때만 traceback 모듈 로드)
+        import traceback
+        traceback.print_exc()
+
+def main():
+    """메인 함수"""
+    try:
+        options = parse_cli_args(sys.argv[1:])
+    except ValueError as e:
+        print(e)
+        options = {'paths': []}
+    if not options['paths']:
+        print(USAGE)
+        sys.exit(1)
+
+    # 여러 파일을 처리할 때는 식별자/문자열을 하나의 SymbolTable로 인터닝하여 공유
+    paths = options['paths']
+    symbols = None
+    if len(paths) > 1:
+        from c_symbols import SymbolTable
+        symbols = SymbolTable()
+    for path in paths:
+        if len(paths) > 1:
+            print(f"==> {path} <==", flush=True)
+        run_file(path, options, symbols)
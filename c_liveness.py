@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+c_liveness.py
+활성 변수 분석과 죽은 선언/대입 제거 (--dce를 쓸 때만 불러옴)
+"""
+
+# 모듈 이름이 숫자로 시작하므로 import 문 대신 __import__ 사용
+c_ast = __import__('2025_assignment2')
+Program = c_ast.Program
+FunctionDecl = c_ast.FunctionDecl
+CompoundStmt = c_ast.CompoundStmt
+Decl = c_ast.Decl
+ArrayDecl = c_ast.ArrayDecl
+InitList = c_ast.InitList
+ArrayRef = c_ast.ArrayRef
+ID = c_ast.ID
+BinaryOp = c_ast.BinaryOp
+Assignment = c_ast.Assignment
+FuncCall = c_ast.FuncCall
+Return = c_ast.Return
+
+class LivenessAnalyzer:
+    """블록을 거꾸로 훑는 활성 변수 분석으로 죽은 선언/대입(dead store)을 찾는 클래스
+    
+    printf 인자와 return 식이 읽는 변수만 관찰 가능한 값으로 보고, 그 값에 영향을 주지 않는
+    Decl/Assignment 문장을 dead 집합에 모읍니다. 함수 호출이나 중첩 대입이 들어 있는 문장은
+    부작용이 있을 수 있으므로 항상 살아 있는 것으로 취급합니다.
+    """
+    def __init__(self):
+        self.dead = set()  # 죽은 문장 노드 집합
+    
+    @property
+    def removed_count(self):
+        """제거된(죽은) 문장 수"""
+        return len(self.dead)
+    
+    def analyze(self, node):
+        """프로그램 또는 함수의 모든 블록을 분석하고 죽은 문장 집합 반환"""
+        if isinstance(node, Program):
+            for decl in node.declarations:
+                self.analyze(decl)
+        elif isinstance(node, FunctionDecl):
+            self.analyze_block(node.body, set())
+        return self.dead
+    
+    def analyze_block(self, block, live):
+        """블록 끝에서 살아 있는 변수 집합(live)으로부터 거꾸로 분석하여 블록 시작의 live 반환"""
+        for item in reversed(block.block_items):
+            if isinstance(item, Decl):
+                target = item.name
+                expr = item.init
+            elif isinstance(item, Assignment) and isinstance(item.lvalue, ID):
+                target = item.lvalue.name
+                expr = item.rvalue
+            elif isinstance(item, Assignment) and isinstance(item.lvalue, ArrayRef) and isinstance(item.lvalue.name, ID):
+                # 배열 원소 저장: 배열이 죽었으면 제거, 살아 있어도 나머지 원소 때문에 배열은 계속 살아 있음
+                name = item.lvalue.name.name
+                if name not in live and not (self.has_side_effects(item.lvalue) or self.has_side_effects(item.rvalue)):
+                    self.dead.add(item)
+                else:
+                    self.collect_uses(item, live)
+                continue
+            else:
+                # printf, return, 기타 식: 읽는 변수가 모두 살아 있음
+                self.collect_uses(item, live)
+                continue
+            
+            exprs = [expr, item.dim] if isinstance(item, ArrayDecl) else [expr]
+            if target not in live and not any(self.has_side_effects(e) for e in exprs):
+                self.dead.add(item)
+                continue
+            live.discard(target)
+            self.collect_uses(item, live)
+        return live
+    
+    def collect_uses(self, node, names):
+        """노드가 읽는 변수 이름을 names에 추가"""
+        if isinstance(node, ID):
+            names.add(node.name)
+        elif isinstance(node, BinaryOp):
+            self.collect_uses(node.left, names)
+            self.collect_uses(node.right, names)
+        elif isinstance(node, Assignment):
+            if not isinstance(node.lvalue, ID):
+                self.collect_uses(node.lvalue, names)
+            self.collect_uses(node.rvalue, names)
+        elif isinstance(node, FuncCall):
+            for arg in node.args:
+                self.collect_uses(arg, names)
+        elif isinstance(node, Decl):
+            if node.init is not None:
+                self.collect_uses(node.init, names)
+            if isinstance(node, ArrayDecl) and node.dim is not None:
+                self.collect_uses(node.dim, names)
+        elif isinstance(node, InitList):
+            for expr in node.exprs:
+                self.collect_uses(expr, names)
+        elif isinstance(node, ArrayRef):
+            self.collect_uses(node.name, names)
+            self.collect_uses(node.subscript, names)
+        elif isinstance(node, Return):
+            if node.expr is not None:
+                self.collect_uses(node.expr, names)
+        elif isinstance(node, CompoundStmt):
+            self.analyze_block(node, names)
+    
+    def has_side_effects(self, node):
+        """식에 함수 호출이나 대입이 들어 있는지 확인"""
+        if isinstance(node, (FuncCall, Assignment)):
+            return True
+        if isinstance(node, BinaryOp):
+            return self.has_side_effects(node.left) or self.has_side_effects(node.right)
+        if isinstance(node, ArrayRef):
+            return self.has_side_effects(node.subscript)
+        if isinstance(node, InitList):
+            return any(self.has_side_effects(expr) for expr in node.exprs)
+        return False
+    
+    def prune(self, node):
+        """죽은 문장을 뺀 AST 사본 반환 (AST 출력용, 원본은 그대로 둠)"""
+        if isinstance(node, Program):
+            pruned = Program([self.prune(decl) for decl in node.declarations])
+        elif isinstance(node, FunctionDecl):
+            pruned = FunctionDecl(node.return_type, node.name, node.params, self.prune(node.body))
+        elif isinstance(node, CompoundStmt):
+            pruned = CompoundStmt([self.prune(item) for item in node.block_items if item not in self.dead])
+        else:
+            return node
+        pruned.line = node.line
+        return pruned
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+c_node_index.py
+노드 종류별 목록과 def-use 체인 인덱스 (CParser(tokens, index=True)일 때만 불러옴)
+"""
+
+# 모듈 이름이 숫자로 시작하므로 import 문 대신 __import__ 사용
+c_ast = __import__('2025_assignment2')
+ASTNode = c_ast.ASTNode
+Program = c_ast.Program
+FunctionDecl = c_ast.FunctionDecl
+CompoundStmt = c_ast.CompoundStmt
+Decl = c_ast.Decl
+ArrayDecl = c_ast.ArrayDecl
+InitList = c_ast.InitList
+ArrayRef = c_ast.ArrayRef
+ID = c_ast.ID
+BinaryOp = c_ast.BinaryOp
+Assignment = c_ast.Assignment
+FuncCall = c_ast.FuncCall
+Return = c_ast.Return
+
+class NodeIndex:
+    """노드 종류별 목록과 변수별 선언/정의/사용 위치(def-use 체인)를 담는 인덱스
+    
+    파서가 노드를 만들 때마다 함께 채워지므로, 조회할 때 트리를 다시 순회하지 않습니다.
+    위치는 (줄 번호, 노드) 튜플로 저장합니다.
+    """
+    def __init__(self):
+        self.by_kind = {}  # {노드 클래스 이름: [노드, ...]} (ArrayDecl은 'Decl' 아래에도 등록)
+        self.kind_names = {}  # {노드 클래스: [자기 자신과 상위 노드 클래스 이름, ...]} (캐시)
+        self.decl_sites = {}  # {변수이름: [(줄, Decl), ...]}
+        self.def_sites = {}  # {변수이름: [(줄, Decl 또는 Assignment), ...]}
+        self.use_sites = {}  # {변수이름: [(줄, ID), ...]}
+        self.call_sites = {}  # {함수이름: [(줄, FuncCall), ...]}
+    
+    @classmethod
+    def from_ast(cls, node):
+        """이미 만들어진(또는 수정된) AST를 순회하여 인덱스를 다시 구성"""
+        index = cls()
+        index.add_tree(node)
+        return index
+    
+    def add(self, node):
+        """노드를 종류별 목록과 def-use 체인에 등록"""
+        names = self.kind_names.get(type(node))
+        if names is None:
+            names = [cls.__name__ for cls in type(node).__mro__ if issubclass(cls, ASTNode) and cls is not ASTNode]
+            self.kind_names[type(node)] = names
+        for name in names:
+            self.by_kind.setdefault(name, []).append(node)
+        site = (node.line, node)
+        if isinstance(node, Decl):
+            self.decl_sites.setdefault(node.name, []).append(site)
+            if node.init is not None:
+                self.def_sites.setdefault(node.name, []).append(site)
+        elif isinstance(node, Assignment):
+            if isinstance(node.lvalue, ID):
+                self.mark_def(node.lvalue, node)
+            elif isinstance(node.lvalue, ArrayRef) and isinstance(node.lvalue.name, ID):
+                # 배열 원소에 저장하는 것도 배열 변수의 정의로 기록
+                self.mark_def(node.lvalue.name, node)
+        elif isinstance(node, ID):
+            self.use_sites.setdefault(node.name, []).append(site)
+        elif isinstance(node, FuncCall):
+            self.call_sites.setdefault(node.name, []).append(site)
+    
+    def mark_def(self, lvalue, assignment):
+        """대입 대상 ID를 사용 위치에서 빼고 정의 위치로 등록"""
+        uses = self.use_sites.get(lvalue.name, [])
+        for i in range(len(uses) - 1, -1, -1):
+            if uses[i][1] is lvalue:
+                del uses[i]
+                break
+        self.def_sites.setdefault(lvalue.name, []).append((assignment.line, assignment))
+    
+    def add_tree(self, node):
+        """하위 노드부터 차례로 등록 (파서가 노드를 만드는 순서와 같음)"""
+        if isinstance(node, Program):
+            children = node.declarations
+        elif isinstance(node, FunctionDecl):
+            children = [node.body]
+        elif isinstance(node, CompoundStmt):
+            children = node.block_items
+        elif isinstance(node, ArrayDecl):
+            children = [child for child in (node.dim, node.init) if child is not None]
+        elif isinstance(node, Decl):
+            children = [node.init] if node.init is not None else []
+        elif isinstance(node, InitList):
+            children = node.exprs
+        elif isinstance(node, ArrayRef):
+            children = [node.name, node.subscript]
+        elif isinstance(node, BinaryOp):
+            children = [node.left, node.right]
+        elif isinstance(node, Assignment):
+            children = [node.lvalue, node.rvalue]
+        elif isinstance(node, FuncCall):
+            children = node.args
+        elif isinstance(node, Return):
+            children = [node.expr] if node.expr is not None else []
+        else:
+            children = []
+        for child in children:
+            self.add_tree(child)
+        self.add(node)
+    
+    def nodes(self, kind):
+        """종류별 노드 목록 (kind는 클래스 또는 클래스 이름, 하위 클래스 노드 포함: nodes('Decl')에는 ArrayDecl도 있음)"""
+        if isinstance(kind, type):
+            kind = kind.__name__
+        return self.by_kind.get(kind, [])
+    
+    def calls(self, name):
+        """함수 호출 위치 목록 (예: 모든 printf 호출)"""
+        return self.call_sites.get(name, [])
+    
+    def declarations(self, name):
+        """변수 선언 위치 목록"""
+        return self.decl_sites.get(name, [])
+    
+    def defs(self, name):
+        """변수에 값이 저장되는 위치 목록 (초기화가 있는 선언과 대입)"""
+        return self.def_sites.get(name, [])
+    
+    def uses(self, name):
+        """변수 값을 읽는 위치 목록"""
+        return self.use_sites.get(name, [])
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+c_parallel_lex.py
+큰 파일을 줄 경계에서 나누어 여러 프로세스로 렉싱 (--jobs를 쓸 때만 불러옴)
+"""
+
+# 모듈 이름이 숫자로 시작하므로 import 문 대신 __import__ 사용
+c_ast = __import__('2025_assignment2')
+CLexer = c_ast.CLexer
+CToken = c_ast.CToken
+
+# 조각 하나의 최소 크기 (바이트). 이보다 작게 나누면 프로세스 풀을 띄우는 비용이 렉싱 시간보다 큼
+MIN_CHUNK_SIZE = 256 * 1024
+
+def split_chunks(code, chunk_size):
+    """병렬 렉싱을 위해 코드를 줄 경계에서 나누고 (시작, 끝, 시작 줄 번호) 목록 반환
+    
+    str.find로 주석/문자열/전처리기 줄만 빠르게 건너뛰는 사전 스캔으로, 여러 줄 주석이나
+    문자열 안의 줄바꿈에서는 나누지 않습니다. 줄 번호는 CLexer와 같게 문자열 밖의 줄바꿈만 셉니다.
+    """
+    n = len(code)
+    chunks = []
+    start = 0
+    line = 1
+    hidden = 0  # start 이후 문자열 안에 있어서 줄 번호에 세지 않는 줄바꿈 수
+    target = chunk_size
+    i = 0
+    next_special = {char: code.find(char) for char in '"/#'}  # 각 특수 문자의 다음 위치 (캐시)
+    
+    while True:
+        # 다음 특수 문자 찾기 (이미 지나간 위치만 다시 찾음)
+        for char, pos in next_special.items():
+            if 0 <= pos < i:
+                next_special[char] = code.find(char, i)
+        candidates = [pos for pos in next_special.values() if pos >= 0]
+        special = min(candidates) if candidates else n
+        
+        # 특수 문자 전까지는 어느 줄바꿈에서나 나눌 수 있음
+        while target < special:
+            split = code.find('\n', max(target - 1, i), special)
+            if split < 0:
+                break
+            split += 1
+            line_at_split = line + code.count('\n', start, split) - hidden
+            chunks.append((start, split, line))
+            start, line, hidden = split, line_at_split, 0
+            target = split + chunk_size
+        if special >= n:
+            break
+        
+        # 특수 영역 끝 찾기
+        char = code[special]
+        if char == '"':
+            # 문자열: CLexer는 문자열 안의 줄바꿈을 줄 번호에 세지 않음
+            j = special + 1
+            while True:
+                quote = code.find('"', j)
+                backslash = code.find('\\', j, quote if quote >= 0 else n)
+                if backslash >= 0:
+                    j = backslash + 2
+                    continue
+                end = quote + 1 if quote >= 0 else n
+                break
+            hidden += code.count('\n', special, end)
+        elif char == '/' and code.startswith('/*', special):
+            close = code.find('*/', special + 2)
+            end = close + 2 if close >= 0 else n
+        elif char == '/' and code.startswith('//', special) or char == '#':
+            # 한 줄 주석과 전처리기 줄은 줄바꿈에서 끝나므로 그 줄바꿈에서는 나눌 수 있음
+            newline = code.find('\n', special)
+            end = newline if newline >= 0 else n
+        else:
+            end = special + 1
+        i = min(end, n)
+        if target < i:
+            target = i
+    
+    chunks.append((start, n, line))
+    return chunks
+
+def lex_chunk(args):
+    """코드 조각 하나를 렉싱 (작업 프로세스에서 실행, 전송 비용을 줄이려고 튜플로 반환)"""
+    chunk, line = args
+    lexer = CLexer(chunk, quiet=True)
+    lexer.line = line
+    tokens = lexer.tokenize()
+    return [(token.type, token.value, token.line) for token in tokens], lexer.warnings
+
+def parallel_tokenize(code, jobs=None, chunk_size=None, quiet=False, symbols=None):
+    """코드를 줄 경계에서 나누어 여러 프로세스로 렉싱하고 CLexer.tokenize()와 같은 토큰 목록 반환
+    
+    chunk_size를 주지 않으면 조각은 MIN_CHUNK_SIZE 이상이며, 코드가 그보다 작으면 직렬 렉서를 사용합니다.
+    symbols가 있으면 작업 프로세스가 아니라 토큰을 합치는 쪽에서 인터닝합니다.
+    """
+    import os
+    if jobs is not None and jobs < 0:
+        raise ValueError(f"Invalid number of jobs: {jobs}")
+    jobs = jobs or os.cpu_count() or 1
+    chunk_size = chunk_size or max(len(code) // jobs, MIN_CHUNK_SIZE)
+    chunks = split_chunks(code, chunk_size) if jobs > 1 and len(code) > chunk_size else []
+    if len(chunks) <= 1:
+        return CLexer(code, quiet=quiet, symbols=symbols).tokenize()
+    
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=min(jobs, len(chunks))) as executor:
+        results = list(executor.map(lex_chunk, [(code[start:end], line) for start, end, line in chunks]))
+    
+    interned_types = (CToken.IDENTIFIER, CToken.KEYWORD, CToken.TYPE, CToken.STRING)
+    tokens = []
+    for chunk_tokens, warnings in results:
+        for type, value, line in chunk_tokens:
+            if symbols is not None and type in interned_types:
+                symbol = symbols.intern(value)
+                tokens.append(CToken(type, symbols.names[symbol], line, symbol))
+            else:
+                tokens.append(CToken(type, value, line))
+        if not quiet:
+            for warning in warnings:
+                print(warning)
+    return tokens
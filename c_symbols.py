@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+c_symbols.py
+여러 파일이 함께 쓰는 식별자/문자열 인터닝 테이블 (여러 파일을 처리할 때만 불러옴)
+"""
+
+class SymbolTable:
+    """여러 파일이 함께 쓰는 이름/문자열 인터닝 테이블 (이름 <-> 정수 ID)
+    
+    같은 이름은 파일이 달라도 하나의 문자열 객체와 ID를 공유하므로, 전체 AST의 메모리는
+    이름이 나온 횟수가 아니라 서로 다른 이름의 수에 비례합니다.
+    """
+    def __init__(self):
+        self.ids = {}  # {이름: ID}
+        self.names = []  # ID 순서의 정규 문자열 객체
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def intern(self, name):
+        """이름의 ID 반환 (처음 보는 이름이면 등록)"""
+        symbol = self.ids.get(name)
+        if symbol is None:
+            symbol = len(self.names)
+            self.ids[name] = symbol
+            self.names.append(name)
+        return symbol
+    
+    def name(self, symbol):
+        """ID에 해당하는 이름"""
+        return self.names[symbol]
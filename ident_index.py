@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ident_index.py
+여러 C 파일에 대한 식별자 역색인(inverted index) 생성 및 조회
+
+CLexer의 토큰 스트림에서 IDENTIFIER/KEYWORD 토큰만 모으므로, grep과 달리
+주석이나 문자열 안의 단어는 색인되지 않습니다. 색인은 SQLite 파일에 저장되어
+조회할 때 소스 파일을 다시 읽지 않습니다.
+
+사용법:
+  python ident_index.py build <index_file> <path> [<path> ...]
+  python ident_index.py query <index_file> <name> [<name> ...]
+"""
+
+import os
+import sqlite3
+import sys
+
+SOURCE_EXTENSIONS = ('.c', '.h')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    name TEXT NOT NULL,
+    file_id INTEGER NOT NULL REFERENCES files(id),
+    line INTEGER NOT NULL,
+    kind TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS postings_name ON postings(name);
+CREATE INDEX IF NOT EXISTS postings_file ON postings(file_id);
+'''
+
+def load_lexer():
+    """2025_assignment2 모듈의 CLexer/CToken 로드 (모듈 이름이 숫자로 시작하므로 __import__ 사용)"""
+    module = __import__('2025_assignment2')
+    return module.CLexer, module.CToken
+
+def iter_source_files(paths):
+    """경로 목록에서 C 소스 파일을 찾아 절대 경로로 반환"""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(SOURCE_EXTENSIONS):
+                        yield os.path.abspath(os.path.join(root, name))
+        elif os.path.isfile(path):
+            yield os.path.abspath(path)
+
+def extract_postings(path, lexer_class, token_class):
+    """파일을 렉싱하여 (이름, 줄, 종류) 목록 반환 (같은 줄의 중복은 제거)"""
+    with open(path, 'r', errors='replace') as f:
+        code = f.read()
+    seen = set()
+    postings = []
+    for token in lexer_class(code, quiet=True).tokenize():
+        if token.type not in (token_class.IDENTIFIER, token_class.KEYWORD):
+            continue
+        key = (token.value, token.line)
+        if key not in seen:
+            seen.add(key)
+            postings.append((token.value, token.line, token.type))
+    return postings
+
+def open_index(index_file):
+    """색인 파일 열기 (없으면 스키마 생성)"""
+    conn = sqlite3.connect(index_file)
+    conn.executescript(SCHEMA)
+    return conn
+
+def build_index(index_file, paths):
+    """색인 생성/갱신 (크기나 수정 시각이 바뀐 파일만 다시 렉싱)
+
+    읽거나 렉싱할 수 없는 파일은 건너뛰고 표준 오류로 알리며, 나머지 파일은 계속 색인합니다.
+    (다시 렉싱한 파일 수, 변경 없는 파일 수, 삭제된 파일 수, 건너뛴 파일 수) 반환
+    """
+    lexer_class, token_class = load_lexer()
+    conn = open_index(index_file)
+    known = {path: (file_id, size, mtime_ns)
+             for file_id, path, size, mtime_ns in conn.execute('SELECT id, path, size, mtime_ns FROM files')}
+    updated = unchanged = skipped = 0
+    seen = set()
+
+    with conn:
+        for path in iter_source_files(paths):
+            if path in seen:
+                continue
+            seen.add(path)
+            entry = known.get(path)
+            try:
+                stat = os.stat(path)
+                if entry and entry[1] == stat.st_size and entry[2] == stat.st_mtime_ns:
+                    unchanged += 1
+                    continue
+                postings = extract_postings(path, lexer_class, token_class)
+            except (OSError, TypeError, ValueError) as e:
+                # 깨진 심볼릭 링크, 읽기 오류, 렉서 오류(예: 파일 끝의 닫히지 않은 문자열) 등
+                print(f"Skipped {path}: {e}", file=sys.stderr)
+                skipped += 1
+                if entry:
+                    # 예전 색인이 남지 않도록 지우고, 다음 build에서 다시 시도
+                    conn.execute('DELETE FROM postings WHERE file_id = ?', (entry[0],))
+                    conn.execute('DELETE FROM files WHERE id = ?', (entry[0],))
+                continue
+
+            if entry:
+                file_id = entry[0]
+                conn.execute('DELETE FROM postings WHERE file_id = ?', (file_id,))
+                conn.execute('UPDATE files SET size = ?, mtime_ns = ? WHERE id = ?',
+                             (stat.st_size, stat.st_mtime_ns, file_id))
+            else:
+                file_id = conn.execute('INSERT INTO files (path, size, mtime_ns) VALUES (?, ?, ?)',
+                                       (path, stat.st_size, stat.st_mtime_ns)).lastrowid
+            conn.executemany('INSERT INTO postings (name, file_id, line, kind) VALUES (?, ?, ?, ?)',
+                             [(name, file_id, line, kind) for name, line, kind in postings])
+            updated += 1
+
+        # 색인 대상 경로 아래에서 사라진 파일 정리
+        roots = [os.path.abspath(p) for p in paths]
+        removed = 0
+        for path, (file_id, _, _) in known.items():
+            under_root = any(path == root or path.startswith(root.rstrip(os.sep) + os.sep) for root in roots)
+            if under_root and path not in seen and not os.path.lexists(path):
+                conn.execute('DELETE FROM postings WHERE file_id = ?', (file_id,))
+                conn.execute('DELETE FROM files WHERE id = ?', (file_id,))
+                removed += 1
+
+    conn.close()
+    return updated, unchanged, removed, skipped
+
+def query_index(index_file, name):
+    """식별자 이름으로 (파일 경로, 줄 번호) 목록 조회"""
+    conn = sqlite3.connect(index_file)
+    try:
+        rows = conn.execute(
+            'SELECT files.path, postings.line FROM postings '
+            'JOIN files ON files.id = postings.file_id '
+            'WHERE postings.name = ? ORDER BY files.path, postings.line', (name,)).fetchall()
+    finally:
+        conn.close()
+    return rows
+
+def main():
+    """메인 함수"""
+    if len(sys.argv) < 4 or sys.argv[1] not in ('build', 'query'):
+        print("Usage: python ident_index.py build <index_file> <path> [<path> ...]")
+        print("       python ident_index.py query <index_file> <name> [<name> ...]")
+        sys.exit(1)
+
+    command, index_file, args = sys.argv[1], sys.argv[2], sys.argv[3:]
+    if command == 'build':
+        updated, unchanged, removed, skipped = build_index(index_file, args)
+        print(f"Indexed {updated} file(s), {unchanged} unchanged, {removed} removed, {skipped} skipped")
+    else:
+        if not os.path.exists(index_file):
+            print(f"Error: index file not found: {index_file}")
+            sys.exit(1)
+        for name in args:
+            for path, line in query_index(index_file, name):
+                print(f"{path}:{line}: {name}")
+
+if __name__ == "__main__":
+    main()
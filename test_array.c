@@ -0,0 +1,14 @@
+int main() {
+    int a[5] = {3, 1, 4};   /* 나머지 원소는 0 */
+    double d[] = {1.5, 2.25};  /* 크기는 초기값 개수 */
+    int i = 2;
+    a[3] = a[0] + a[2];     /* 원소 읽기와 쓰기 */
+    a[i + 2] = a[3] * i;    /* 식으로 된 인덱스 */
+    d[1] = d[0] / 2;
+    int n = a[4];
+    printf("%d", a[1]);
+    printf("%d", a[3]);
+    printf("%d", n);
+    printf("%lf", d[1]);
+    return 0;
+}